@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from fnmatch import fnmatch
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Sequence, Union
 
 from atomate2.utils.file_client import FileClient, auto_fileclient
 
@@ -15,8 +17,11 @@ __all__ = [
     "gzip_files",
     "gunzip_files",
     "get_zfile",
+    "get_zfiles",
 ]
 
+logger = logging.getLogger(__name__)
+
 
 @auto_fileclient
 def copy_files(
@@ -65,6 +70,34 @@ def copy_files(
         file_client, src_dir, include_files, exclude_files, src_host
     )
 
+    if src_host is not None and suffix == "" and len(files) > 1:
+        # try and copy all files in a single stream, preferring rsync and then tar. If
+        # a method is not available for this host (missing executable or ssh cannot
+        # connect), it is not retried for the host. Other errors (e.g., a missing
+        # file) will affect all methods, so fall back to copying files one by one
+        failed_methods = file_client.failed_copy_methods.setdefault(src_host, set())
+        for method_name, copy_many in (
+            ("rsync", file_client.copy_from_host_rsync),
+            ("tar", file_client.copy_from_host_tar),
+        ):
+            if method_name in failed_methods:
+                continue
+            try:
+                copy_many(src_dir, dest_dir, files, src_host)
+                return
+            except (FileNotFoundError, ConnectionError) as e:
+                logger.warning(
+                    f"Could not copy files from {src_host} using {method_name}, it "
+                    f"will not be used for this host again: {e}"
+                )
+                failed_methods.add(method_name)
+            except OSError as e:
+                logger.warning(
+                    f"Could not copy files from {src_host} using {method_name}, "
+                    f"falling back to copying files individually: {e}"
+                )
+                break
+
     for file in files:
         from_file = src_dir / file
         to_file = (dest_dir / file).with_suffix(file.suffix + suffix)
@@ -156,14 +189,11 @@ def rename_files(
         directory = Path.cwd() if host is None else Path("~/")
     directory = file_client.abspath(directory, host=host)
 
-    for old_filename, new_filename in filenames.items():
-        try:
-            file_client.rename(
-                directory / old_filename, directory / new_filename, host=host
-            )
-        except FileNotFoundError:
-            if not allow_missing:
-                raise
+    paths: Dict[Union[str, Path], Union[str, Path]] = {
+        directory / old_filename: directory / new_filename
+        for old_filename, new_filename in filenames.items()
+    }
+    file_client.rename_multiple(paths, host=host, allow_missing=allow_missing)
 
 
 @auto_fileclient
@@ -263,13 +293,22 @@ def gunzip_files(
         file_client, directory, include_files, exclude_files, host
     )
 
-    for file in files:
+    def _gunzip(file):
         try:
             file_client.gunzip(directory / file, host=host, force=force)
         except FileNotFoundError:
             if not allow_missing:
                 raise
 
+    if host is None and len(files) > 1:
+        # decompression releases the GIL so local files can be gunzipped in parallel;
+        # consume the results so that any exceptions are raised
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+            list(executor.map(_gunzip, files))
+    else:
+        for file in files:
+            _gunzip(file)
+
 
 def find_and_filter_files(
     file_client: FileClient,
@@ -365,3 +404,49 @@ def get_zfile(
         return None
 
     raise FileNotFoundError(f"Could not find {base_name} or {base_name}.gz file.")
+
+
+def get_zfiles(
+    directory_listing: List[Path],
+    base_names: Sequence[str],
+    allow_missing: bool = False,
+) -> List[Optional[Path]]:
+    """
+    Find gzipped or non-gzipped versions of several files in a directory listing.
+
+    This is equivalent to calling :obj:`get_zfile` for each base name but only loops
+    through the directory listing once.
+
+    Parameters
+    ----------
+    directory_listing
+        A list of files in a directory.
+    base_names
+        The base names of the files to find.
+    allow_missing
+        Whether to error if no version of a file (gzipped or un-gzipped) can be found.
+
+    Returns
+    -------
+    list[Path or None]
+        The paths to the matched files, in the same order as ``base_names``. If
+        ``allow_missing=True``, files that cannot be found will be ``None``.
+    """
+    # index each file by its full name and its name without a gzip extension; keeping
+    # the first entry for each name gives the same matches as get_zfile
+    files_by_base_name: Dict[str, Path] = {}
+    for file in directory_listing:
+        files_by_base_name.setdefault(file.name, file)
+        if file.name.endswith((".gz", ".GZ")):
+            files_by_base_name.setdefault(file.name[:-3], file)
+
+    files = []
+    for base_name in base_names:
+        file = files_by_base_name.get(base_name)
+        if file is None and not allow_missing:
+            raise FileNotFoundError(
+                f"Could not find {base_name} or {base_name}.gz file."
+            )
+        files.append(file)
+
+    return files
@@ -3,14 +3,18 @@
 
 from __future__ import annotations
 
+import shlex
 import shutil
+import socket
 import stat
+import subprocess
+import tempfile
 import warnings
 from functools import wraps
 from glob import glob
 from gzip import GzipFile
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set, Union
 
 import paramiko
 from monty.io import zopen
@@ -18,6 +22,11 @@ from paramiko import SFTPClient, SSHClient
 
 __all__ = ["FileClient", "auto_fileclient"]
 
+_COPY_BUFFER_SIZE = 1024 * 1024
+_MISSING_FILE_EXIT_CODE = 100
+_COMMAND_NOT_FOUND_EXIT_CODE = 127
+_SSH_ERROR_EXIT_CODE = 255
+
 
 class FileClient:
     """
@@ -54,6 +63,9 @@ class FileClient:
 
         self.connections: Dict[str, Dict[str, Any]] = {}
 
+        # names of bulk copy methods (e.g., "rsync") that have failed for each host
+        self.failed_copy_methods: Dict[str, Set[str]] = {}
+
     def connect(self, host):
         """
         Connect to a remote host.
@@ -268,6 +280,127 @@ class FileClient:
                 "Copying between two different remote hosts is not supported."
             )
 
+    def copy_from_host_tar(
+        self,
+        src_dir: Union[str, Path],
+        dest_dir: Union[str, Path],
+        filenames: Sequence[Union[str, Path]],
+        src_host: str,
+    ):
+        """
+        Copy several files from a remote host to the local machine in one stream.
+
+        The files are piped through ``tar`` over a single ``ssh`` connection, avoiding
+        the per-file round trips of SFTP. Symbolic links are followed, so the linked
+        files are copied rather than the links themselves. Requires the ``ssh`` and
+        ``tar`` executables to be available on the local machine.
+
+        A ``FileNotFoundError`` is raised if the ``ssh`` or ``tar`` executables are not
+        available and a ``ConnectionError`` if ``ssh`` cannot connect to the host. Other
+        failures, such as a missing file, raise an ``OSError``.
+
+        Parameters
+        ----------
+        src_dir
+            Full path to the source directory on the remote host.
+        dest_dir
+            Full path to the local destination directory.
+        filenames
+            Files to copy, given relative to ``src_dir``.
+        src_host
+            A remote file system host for the source files.
+        """
+        if shutil.which("ssh") is None or shutil.which("tar") is None:
+            raise FileNotFoundError("ssh and tar executables are required.")
+
+        files = " ".join(shlex.quote(str(f)) for f in filenames)
+        # dereference symlinks so that linked files are copied, as with sftp get
+        tar_command = f"tar chf - -C {shlex.quote(str(src_dir))} -- {files}"
+        ssh_command = self._get_ssh_command() + [src_host, tar_command]
+
+        # ssh stderr is written to a file rather than a pipe; a full stderr pipe would
+        # block ssh while the local tar is still waiting for input
+        with tempfile.TemporaryFile() as ssh_stderr:
+            with subprocess.Popen(
+                ssh_command, stdout=subprocess.PIPE, stderr=ssh_stderr
+            ) as ssh_process:
+                extract = subprocess.run(
+                    ["tar", "xf", "-", "-C", str(dest_dir)],
+                    stdin=ssh_process.stdout,
+                    stderr=subprocess.PIPE,
+                )
+                ssh_process.stdout.close()
+            ssh_stderr.seek(0)
+            ssh_error = ssh_stderr.read().decode()
+
+        if ssh_process.returncode != 0:
+            _raise_copy_error(ssh_process.returncode, ssh_error)
+        if extract.returncode != 0:
+            _raise_copy_error(extract.returncode, extract.stderr.decode())
+
+    def copy_from_host_rsync(
+        self,
+        src_dir: Union[str, Path],
+        dest_dir: Union[str, Path],
+        filenames: Sequence[Union[str, Path]],
+        src_host: str,
+    ):
+        """
+        Copy several files from a remote host to the local machine using rsync.
+
+        All files are transferred in a single compressed rsync session over ``ssh``.
+        Files that are already present and unchanged in the destination are skipped and
+        symbolic links are followed. Requires ``rsync`` on both the local machine and
+        the remote host, and the ``ssh`` executable on the local machine.
+
+        A ``FileNotFoundError`` is raised if the ``ssh`` or ``rsync`` executables are
+        not available and a ``ConnectionError`` if ``ssh`` cannot connect to the host.
+        Other failures, such as a missing file, raise an ``OSError``.
+
+        Parameters
+        ----------
+        src_dir
+            Full path to the source directory on the remote host.
+        dest_dir
+            Full path to the local destination directory.
+        filenames
+            Files to copy, given relative to ``src_dir``.
+        src_host
+            A remote file system host for the source files.
+        """
+        if shutil.which("ssh") is None or shutil.which("rsync") is None:
+            raise FileNotFoundError("ssh and rsync executables are required.")
+
+        ssh_command = " ".join(shlex.quote(c) for c in self._get_ssh_command())
+        rsync_command = [
+            "rsync",
+            "-azqL",  # -L copies the files that symlinks point to, as with sftp get
+            "--inplace",
+            "--files-from=-",
+            "--protect-args",
+            "-e",
+            ssh_command,
+            f"{src_host}:{src_dir}/",
+            f"{dest_dir}/",
+        ]
+        files = "\n".join(str(f) for f in filenames)
+        result = subprocess.run(
+            rsync_command, input=files.encode(), stderr=subprocess.PIPE
+        )
+        if result.returncode != 0:
+            _raise_copy_error(result.returncode, result.stderr.decode())
+
+    def _get_ssh_command(self) -> List[str]:
+        """Get the arguments for the ssh executable, including any key and config."""
+        ssh_command = ["ssh", "-o", "BatchMode=yes"]
+        key_filename = Path(self.key_filename).expanduser()
+        if key_filename.exists():
+            ssh_command += ["-i", str(key_filename)]
+        config_filename = Path(self.config_filename).expanduser()
+        if config_filename.exists():
+            ssh_command += ["-F", str(config_filename)]
+        return ssh_command
+
     def remove(self, path: Union[str, Path], host: Optional[str] = None):
         """
         Remove a file (does not work on directories).
@@ -310,6 +443,64 @@ class FileClient:
             new_path = str(self.abspath(new_path, host=host))
             self.get_sftp(host).rename(old_path, new_path)
 
+    def rename_multiple(
+        self,
+        paths: Mapping[Union[str, Path], Union[str, Path]],
+        host: Optional[str] = None,
+        allow_missing: bool = False,
+    ):
+        """
+        Rename (move) several files at once.
+
+        On remote hosts, all renames are performed using a single command rather than
+        one request per file. As with :obj:`pathlib.Path.rename` on POSIX systems,
+        existing destination files will be overwritten.
+
+        Parameters
+        ----------
+        paths
+            Files to rename, given as a dictionary of ``{old_path: new_path}``. Paths
+            should be absolute. Renames are performed in the order given.
+        host
+            A remote file system host on which to perform file operations.
+        allow_missing
+            Whether to skip (rather than error on) files that do not exist.
+        """
+        if host is None:
+            for old_path, new_path in paths.items():
+                try:
+                    Path(old_path).rename(new_path)
+                except FileNotFoundError:
+                    if not allow_missing:
+                        raise
+            return
+
+        commands = []
+        for old_path, new_path in paths.items():
+            old_path = shlex.quote(str(old_path))
+            new_path = shlex.quote(str(new_path))
+            move = f"mv -f {old_path} {new_path}"
+            if allow_missing:
+                commands.append(f"{{ [ ! -e {old_path} ] || {move}; }}")
+            else:
+                # use a distinct exit code for missing files so that they can be
+                # detected regardless of the locale used for error messages
+                missing = f"exit {_MISSING_FILE_EXIT_CODE}"
+                commands.append(f"{{ [ -e {old_path} ] || {missing}; }} && {move}")
+
+        if len(commands) == 0:
+            return
+
+        ssh = self.get_ssh(host)
+        script = " && ".join(commands)
+        _, stdout, stderr = ssh.exec_command(f"sh -c {shlex.quote(script)}")
+        exit_status = stdout.channel.recv_exit_status()
+        if exit_status == _MISSING_FILE_EXIT_CODE:
+            raise FileNotFoundError(f"Could not find file to rename on {host}.")
+        elif exit_status != 0:
+            error = "".join(stderr.readlines())
+            raise OSError(f"Rename command gave error: {error}")
+
     def abspath(self, path: Union[str, Path], host: Optional[str] = None) -> Path:
         """
         Get the absolute path.
@@ -434,7 +625,7 @@ class FileClient:
 
         if host is None:
             with open(path_nongz, "wb") as f_out, zopen(path, "rb") as f_in:
-                f_out.writelines(f_in)
+                shutil.copyfileobj(f_in, f_out, length=_COPY_BUFFER_SIZE)
             path.unlink()
         else:
             ssh = self.get_ssh(host)
@@ -504,9 +695,26 @@ def get_ssh_connection(
     client = paramiko.SSHClient()
     client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
     client.connect(**config)
+
+    # the connection is reused for all operations on this host, so disable Nagle's
+    # algorithm to avoid delaying the many small sftp requests; the buffer sizes are
+    # left to the kernel's autotuning
+    sock = client.get_transport().sock
+    if isinstance(sock, socket.socket):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
     return client
 
 
+def _raise_copy_error(returncode: int, error: str):
+    """Raise an exception for a failed bulk copy command based on its exit code."""
+    if returncode == _COMMAND_NOT_FOUND_EXIT_CODE:
+        raise FileNotFoundError(f"Copy command not found: {error}")
+    elif returncode == _SSH_ERROR_EXIT_CODE:
+        raise ConnectionError(f"Could not connect to host: {error}")
+    raise OSError(f"Copy command gave error: {error}")
+
+
 def auto_fileclient(method: Optional[Callable] = None):
     """
     Automatically pass a FileClient to the function if not already present in kwargs.
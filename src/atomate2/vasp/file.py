@@ -5,9 +5,9 @@ from __future__ import annotations
 import logging
 import re
 from pathlib import Path
-from typing import Optional, Sequence, Union
+from typing import List, Optional, Sequence, Union
 
-from atomate2.common.file import copy_files, get_zfile, gunzip_files, rename_files
+from atomate2.common.file import copy_files, get_zfiles, gunzip_files, rename_files
 from atomate2.utils.file_client import FileClient, auto_fileclient
 from atomate2.utils.path import strip_hostname
 
@@ -15,6 +15,8 @@ __all__ = ["copy_vasp_outputs", "get_largest_relax_extension"]
 
 logger = logging.getLogger(__name__)
 
+_RELAX_RE = re.compile(r"\.relax(\d+)")
+
 
 @auto_fileclient
 def copy_vasp_outputs(
@@ -22,6 +24,7 @@ def copy_vasp_outputs(
     src_host: Optional[str] = None,
     additional_vasp_files: Sequence[str] = tuple(),
     contcar_to_poscar: bool = True,
+    decompress: bool = True,
     file_client: FileClient = None,
 ):
     """
@@ -30,7 +33,8 @@ def copy_vasp_outputs(
     For folders containing multiple calculations (e.g., suffixed with relax1, relax2,
     etc), this function will only copy the files with the highest numbered suffix and
     the suffix will be removed. Additional vasp files will be also be  copied with the
-    same suffix applied. Lastly, this function will gunzip any gzipped files.
+    same suffix applied. Lastly, this function will gunzip any gzipped files, unless
+    ``decompress`` is ``False``.
 
     Parameters
     ----------
@@ -45,6 +49,11 @@ def copy_vasp_outputs(
         Additional files to copy, e.g. ["CHGCAR", "WAVECAR"].
     contcar_to_poscar
         Move CONTCAR to POSCAR (original POSCAR is not copied).
+    decompress
+        Whether to gunzip the copied files. Pymatgen can read gzipped VASP outputs
+        directly, so this can be disabled if the files will not be read by VASP (e.g.,
+        when only used to generate inputs), which avoids decompressing large files such
+        as CHGCAR. Gzipped files will keep their ".gz" extension.
     file_client
         A file client to use for performing file operations.
     """
@@ -52,23 +61,24 @@ def copy_vasp_outputs(
 
     logger.info(f"Copying VASP inputs from {src_dir}")
 
-    relax_ext = get_largest_relax_extension(src_dir, src_host, file_client=file_client)
     directory_listing = file_client.listdir(src_dir, host=src_host)
+    relax_ext = _get_largest_relax_extension_from_listing(directory_listing)
 
     # find required files
     files = ("INCAR", "OUTCAR", "CONTCAR", "vasprun.xml") + tuple(additional_vasp_files)
-    required_files = [get_zfile(directory_listing, r + relax_ext) for r in files]
+    required_files = get_zfiles(directory_listing, [r + relax_ext for r in files])
 
     # find optional files; do not fail if KPOINTS is missing, this might be KSPACING
     # note: POTCAR files never have the relax extension, whereas KPOINTS files should
-    optional_files = []
-    for file in ["POTCAR", "POTCAR.spec", "KPOINTS" + relax_ext]:
-        found_file = get_zfile(directory_listing, file, allow_missing=True)
-        if found_file is not None:
-            optional_files.append(found_file)
+    optional_files = get_zfiles(
+        directory_listing,
+        ["POTCAR", "POTCAR.spec", "KPOINTS" + relax_ext],
+        allow_missing=True,
+    )
+    optional_files = [f for f in optional_files if f is not None]
 
     # check at least one type of POTCAR file is included
-    if len([f for f in optional_files if "POTCAR" in f.name]) == 0:
+    if not any("POTCAR" in f.name for f in optional_files):
         raise FileNotFoundError("Could not find POTCAR file to copy.")
 
     copy_files(
@@ -78,24 +88,26 @@ def copy_vasp_outputs(
         file_client=file_client,
     )
 
-    gunzip_files(
-        include_files=required_files + optional_files,
-        allow_missing=True,
-        file_client=file_client,
-    )
-
-    # rename files to remove relax extension
-    if relax_ext:
-        all_files = optional_files + required_files
-        files_to_rename = {
-            k.name.replace(".gz", ""): k.name.replace(relax_ext, "").replace(".gz", "")
-            for k in all_files
-        }
+    if decompress:
+        gunzip_files(
+            include_files=required_files + optional_files,
+            allow_missing=True,
+            file_client=file_client,
+        )
+
+    # rename files to remove relax extension; all renames are performed in one go
+    files_to_rename = {}
+    for file in optional_files + required_files:
+        old_name = file.name.replace(".gz", "") if decompress else file.name
+        new_name = old_name.replace(relax_ext, "") if relax_ext else old_name
+        if contcar_to_poscar and new_name.startswith("CONTCAR"):
+            new_name = new_name.replace("CONTCAR", "POSCAR", 1)
+        if new_name != old_name:
+            files_to_rename[old_name] = new_name
+
+    if files_to_rename:
         rename_files(files_to_rename, allow_missing=True, file_client=file_client)
 
-    if contcar_to_poscar:
-        rename_files({"CONTCAR": "POSCAR"}, file_client=file_client)
-
     logger.info("Finished copying inputs")
 
 
@@ -127,10 +139,28 @@ def get_largest_relax_extension(
     str
         The relax extension or an empty string if there were not multiple relaxations.
     """
-    relax_files = file_client.glob(Path(directory) / "*.relax*", host=host)
-    if len(relax_files) == 0:
-        return ""
+    directory_listing = file_client.listdir(directory, host=host)
+    return _get_largest_relax_extension_from_listing(directory_listing)
+
+
+def _get_largest_relax_extension_from_listing(directory_listing: List[Path]) -> str:
+    """
+    Get the largest numbered relax extension from a directory listing.
+
+    Parameters
+    ----------
+    directory_listing
+        A list of files in a directory.
+
+    Returns
+    -------
+    str
+        The relax extension or an empty string if there were not multiple relaxations.
+    """
+    max_relax = -1
+    for file in directory_listing:
+        match = _RELAX_RE.search(file.name)
+        if match:
+            max_relax = max(max_relax, int(match.group(1)))
 
-    numbers = [re.search(r".relax(\d+)", file.name).group(1) for file in relax_files]
-    max_relax = max(numbers, key=lambda x: int(x))
-    return f".relax{max_relax}"
+    return f".relax{max_relax}" if max_relax >= 0 else ""
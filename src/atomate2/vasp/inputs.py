@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import importlib
 import logging
+from functools import lru_cache
 from typing import Optional
 
 from pymatgen.core.structure import Structure
@@ -47,7 +48,7 @@ def write_vasp_input_set(
         module = "pymatgen.io.vasp.sets"
 
     try:
-        vis_cls = getattr(importlib.import_module(module), input_set)
+        vis_cls = _resolve_input_set(module, input_set)
     except (ModuleNotFoundError, AttributeError, ImportError):
         raise ImportError(f"Could not import input set {input_set} from {module}.")
 
@@ -59,3 +60,9 @@ def write_vasp_input_set(
 
     logger.info("Writing VASP input set.")
     vis.write_input(".", **write_input_kwargs)
+
+
+@lru_cache(maxsize=None)
+def _resolve_input_set(module: str, input_set: str):
+    """Import an input set class; cached as many jobs will use the same input set."""
+    return getattr(importlib.import_module(module), input_set)
@@ -0,0 +1,90 @@
+import pytest
+
+
+def test_get_zfiles():
+    from pathlib import Path
+
+    from atomate2.common.file import get_zfile, get_zfiles
+
+    directory_listing = [
+        Path(f)
+        for f in (
+            "INCAR.gz",
+            "INCAR",
+            "OUTCAR",
+            "vasprun.xml.GZ",
+            "X.gz",
+            "X",
+            "CHGCAR.gz.gz",
+        )
+    ]
+    base_names = ["INCAR", "OUTCAR", "vasprun.xml", "X", "X.gz", "CHGCAR.gz", "POTCAR"]
+
+    files = get_zfiles(directory_listing, base_names, allow_missing=True)
+    expected = [
+        get_zfile(directory_listing, base_name, allow_missing=True)
+        for base_name in base_names
+    ]
+    assert files == expected
+    assert files[-1] is None
+
+    with pytest.raises(FileNotFoundError):
+        get_zfiles(directory_listing, ["POTCAR"])
+
+
+@pytest.mark.parametrize(
+    "errors,tried,copied,remembered",
+    [
+        ({}, ["rsync"], [], set()),
+        ({"rsync": FileNotFoundError}, ["rsync", "tar"], [], {"rsync"}),
+        (
+            {"rsync": FileNotFoundError, "tar": ConnectionError},
+            ["rsync", "tar"],
+            ["INCAR", "POSCAR"],
+            {"rsync", "tar"},
+        ),
+        ({"rsync": OSError}, ["rsync"], ["INCAR", "POSCAR"], set()),
+        (
+            {"rsync": ConnectionError, "tar": OSError},
+            ["rsync", "tar"],
+            ["INCAR", "POSCAR"],
+            {"rsync"},
+        ),
+    ],
+)
+def test_copy_files_bulk_fallback(errors, tried, copied, remembered):
+    from pathlib import Path
+
+    from atomate2.common.file import copy_files
+    from atomate2.utils.file_client import FileClient
+
+    file_client = FileClient()
+    calls = []
+
+    def mock_copy_many(method_name):
+        def _copy_many(src_dir, dest_dir, filenames, src_host):
+            calls.append(method_name)
+            if method_name in errors:
+                raise errors[method_name]("failed")
+
+        return _copy_many
+
+    def mock_copy(src_filename, dest_filename, src_host=None):
+        calls.append(Path(src_filename).name)
+
+    # avoid any remote commands when resolving paths
+    file_client.abspath = lambda path, host=None: Path(path)
+    file_client.glob = lambda path, host=None: []
+    file_client.copy_from_host_rsync = mock_copy_many("rsync")
+    file_client.copy_from_host_tar = mock_copy_many("tar")
+    file_client.copy = mock_copy
+
+    kwargs = {"src_host": "host", "file_client": file_client}
+    copy_files("/src", "/dest", include_files=["INCAR", "POSCAR"], **kwargs)
+    assert calls == tried + copied
+    assert file_client.failed_copy_methods["host"] == remembered
+
+    # remembered methods should not be tried again
+    calls.clear()
+    copy_files("/src", "/dest", include_files=["INCAR", "POSCAR"], **kwargs)
+    assert not remembered.intersection(calls)
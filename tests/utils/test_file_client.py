@@ -0,0 +1,58 @@
+import pytest
+
+
+def test_copy_from_host_tar_follows_symlinks(tmp_dir, monkeypatch):
+    from pathlib import Path
+
+    import atomate2.utils.file_client
+    from atomate2.utils.file_client import FileClient
+
+    src_dir = Path("src").absolute()
+    prev_dir = Path("prev").absolute()
+    dest_dir = Path("dest").absolute()
+    for directory in (src_dir, prev_dir, dest_dir):
+        directory.mkdir()
+
+    (src_dir / "INCAR").write_text("ISPIN = 1")
+    (prev_dir / "POTCAR").write_text("PAW_PBE Si 05Jan2001")
+    (src_dir / "POTCAR").symlink_to("../prev/POTCAR")
+
+    # run the "remote" tar command using a local shell rather than ssh
+    file_client = FileClient()
+    ssh_command = ["sh", "-c", 'eval "$2"', "sh"]
+    monkeypatch.setattr(file_client, "_get_ssh_command", lambda: ssh_command)
+    monkeypatch.setattr(
+        atomate2.utils.file_client.shutil, "which", lambda cmd: f"/usr/bin/{cmd}"
+    )
+
+    file_client.copy_from_host_tar(src_dir, dest_dir, ["INCAR", "POTCAR"], "host")
+
+    assert (dest_dir / "INCAR").read_text() == "ISPIN = 1"
+    assert not (dest_dir / "POTCAR").is_symlink()
+    assert (dest_dir / "POTCAR").read_text() == "PAW_PBE Si 05Jan2001"
+
+
+@pytest.mark.parametrize(
+    "script,error",
+    [
+        ("exit 255", ConnectionError),
+        ("exit 127", FileNotFoundError),
+        ('eval "$2"', OSError),  # missing file
+    ],
+)
+def test_copy_from_host_tar_errors(tmp_dir, monkeypatch, script, error):
+    from pathlib import Path
+
+    import atomate2.utils.file_client
+    from atomate2.utils.file_client import FileClient
+
+    file_client = FileClient()
+    ssh_command = ["sh", "-c", script, "sh"]
+    monkeypatch.setattr(file_client, "_get_ssh_command", lambda: ssh_command)
+    monkeypatch.setattr(
+        atomate2.utils.file_client.shutil, "which", lambda cmd: f"/usr/bin/{cmd}"
+    )
+
+    with pytest.raises(error) as exc_info:
+        file_client.copy_from_host_tar(Path.cwd(), Path.cwd(), ["INCAR"], "host")
+    assert type(exc_info.value) is error
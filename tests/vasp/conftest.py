@@ -1,13 +1,28 @@
 import logging
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal, Sequence, Union
+from typing import List, Literal, Sequence, Tuple, Union
 
 import pytest
 
 vfiles = ("incar", "kpoints", "potcar", "poscar")
 
+_VASP_INPUT_FILES = (
+    "INCAR",
+    "KPOINTS",
+    "POSCAR",
+    "POTCAR",
+    "CHGCAR",
+    "OUTCAR",
+    "vasprun.xml",
+)
+
 logger = logging.getLogger("atomate2")
 
+_POTCAR_TITEL_RE = re.compile(r"^\s*TITEL\s*=\s*\S+\s+(\S+)")
+
 
 @pytest.fixture(scope="session")
 def vasp_test_dir(test_dir):
@@ -145,18 +160,20 @@ def check_incar(ref_path: Union[str, Path], incar_settings: Sequence[str]):
     from pymatgen.io.vasp import Incar
 
     user = Incar.from_file("INCAR")
-    ref = Incar.from_file(ref_path / "inputs" / "INCAR")
+    ref = _read_ref_input(Incar, *_file_key(ref_path / "inputs" / "INCAR"))
     defaults = {"ISPIN": 1, "ISMEAR": 1, "SIGMA": 0.2}
-    for p in incar_settings:
-        if user.get(p, defaults.get(p)) != ref.get(p, defaults.get(p)):
-            raise ValueError(f"INCAR value of {p} is inconsistent")
+    user = {**defaults, **user}
+    ref = {**defaults, **ref}
+    inconsistent = [p for p in incar_settings if user.get(p) != ref.get(p)]
+    if inconsistent:
+        raise ValueError(f"INCAR value of {', '.join(inconsistent)} is inconsistent")
 
 
 def check_kpoints(ref_path: Union[str, Path]):
     from pymatgen.io.vasp import Kpoints
 
     user = Kpoints.from_file("KPOINTS")
-    ref = Kpoints.from_file(ref_path / "inputs" / "KPOINTS")
+    ref = _read_ref_input(Kpoints, *_file_key(ref_path / "inputs" / "KPOINTS"))
     if user.style != ref.style or user.num_kpts != ref.num_kpts:
         raise ValueError("KPOINTS files are inconsistent")
 
@@ -165,47 +182,100 @@ def check_poscar(ref_path: Union[str, Path]):
     from pymatgen.io.vasp import Poscar
 
     user = Poscar.from_file("POSCAR")
-    ref = Poscar.from_file(ref_path / "inputs" / "POSCAR")
+    ref = _read_ref_input(Poscar, *_file_key(ref_path / "inputs" / "POSCAR"))
     if user.natoms != ref.natoms or user.site_symbols != ref.site_symbols:
         raise ValueError("POSCAR files are inconsistent")
 
 
 def check_potcar(ref_path: Union[str, Path]):
-    from pymatgen.io.vasp import Potcar
-
-    ref = Potcar.from_file(ref_path / "inputs" / "POTCAR")
+    ref_symbols = list(
+        _read_ref_potcar_symbols(*_file_key(ref_path / "inputs" / "POTCAR"))
+    )
 
     if Path("POTCAR").exists():
-        user = Potcar.from_file("POTCAR")
-        if user.symbols != ref.symbols:
+        if get_potcar_symbols("POTCAR") != ref_symbols:
             raise ValueError("POTCAR files are inconsistent")
     elif Path("POTCAR.spec").exists():
         user_spec = Path("POTCAR.spec").read_text().split("\n")
-        if user_spec != ref.symbols:
+        if user_spec != ref_symbols:
             raise ValueError("POTCAR symbols are inconsistent")
     else:
         raise FileNotFoundError("no POTCAR or POTCAR.spec file found")
 
 
+def get_potcar_symbols(path: Union[str, Path]) -> List[str]:
+    """Get the symbols in a POTCAR file without fully parsing it."""
+    from monty.io import zopen
+
+    symbols = []
+    with zopen(path, "rt") as f:
+        for line in f:
+            match = _POTCAR_TITEL_RE.match(line)
+            if match:
+                symbols.append(match.group(1))
+    return symbols
+
+
+def _file_key(path: Union[str, Path]) -> Tuple[str, int, int]:
+    """Get a cache key for a file that is invalidated if the file is modified."""
+    path = Path(path).resolve()
+    stat = os.stat(path)
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=256)
+def _read_ref_input(input_cls, path: str, mtime: int, size: int):
+    # reference inputs are shared between many jobs, only parse them once
+    return input_cls.from_file(path)
+
+
+@lru_cache(maxsize=256)
+def _read_ref_potcar_symbols(path: str, mtime: int, size: int) -> Tuple[str, ...]:
+    return tuple(get_potcar_symbols(path))
+
+
 def clear_vasp_inputs():
-    for vasp_file in (
-        "INCAR",
-        "KPOINTS",
-        "POSCAR",
-        "POTCAR",
-        "CHGCAR",
-        "OUTCAR",
-        "vasprun.xml",
-    ):
-        if Path(vasp_file).exists():
-            Path(vasp_file).unlink()
+    for vasp_file in _VASP_INPUT_FILES:
+        try:
+            os.unlink(vasp_file)
+        except FileNotFoundError:
+            pass
     logger.info("Cleared vasp inputs")
 
 
 def copy_vasp_outputs(ref_path: Union[str, Path]):
+    output_path = ref_path / "outputs"
+    # scandir entries cache the file type so is_file does not need an extra stat
+    with os.scandir(output_path) as entries:
+        for entry in entries:
+            if entry.is_file():
+                copy_file(entry.path, entry.name)
+
+
+def copy_file(src: Union[str, Path], dst: Union[str, Path]):
+    """
+    Copy a file using copy_file_range where possible.
+
+    This avoids copying the data through user space and, on copy-on-write filesystems
+    such as btrfs and xfs, can share the data blocks rather than copying them.
+    """
     import shutil
 
-    output_path = ref_path / "outputs"
-    for output_file in output_path.iterdir():
-        if output_file.is_file():
-            shutil.copy(output_file, ".")
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as f_src, open(dst, "wb") as f_dst:
+                remaining = os.fstat(f_src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(
+                        f_src.fileno(), f_dst.fileno(), remaining
+                    )
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining == 0:
+                    return
+        except OSError:
+            pass
+
+    # fall back to copyfile which will use sendfile where possible
+    shutil.copyfile(src, dst)
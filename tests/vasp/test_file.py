@@ -7,6 +7,7 @@ import pytest
         ({}, ("POSCAR", "INCAR", "KPOINTS", "POTCAR", "OUTCAR", "vasprun.xml")),
         ({"contcar_to_poscar": False}, ("CONTCAR", "INCAR", "KPOINTS")),
         ({"additional_vasp_files": ("PROCAR",)}, ("POSCAR", "INCAR", "PROCAR")),
+        ({"decompress": False}, ("POSCAR.gz", "INCAR.gz", "vasprun.xml.gz")),
     ],
 )
 def test_copy_vasp_outputs_static(vasp_test_dir, tmp_dir, copy_kwargs, files):
@@ -27,6 +28,7 @@ def test_copy_vasp_outputs_static(vasp_test_dir, tmp_dir, copy_kwargs, files):
         ({}, ("POSCAR", "INCAR", "KPOINTS", "POTCAR", "OUTCAR", "vasprun.xml")),
         ({"contcar_to_poscar": False}, ("CONTCAR", "INCAR", "KPOINTS")),
         ({"additional_vasp_files": ("PROCAR",)}, ("POSCAR", "INCAR", "PROCAR")),
+        ({"decompress": False}, ("POSCAR.gz", "INCAR.gz", "vasprun.xml.gz")),
     ],
 )
 def test_copy_vasp_outputs_double(vasp_test_dir, tmp_dir, copy_kwargs, files):